@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pac
+from data_types import DTYPES
+
+# Define the input and output file paths
+input_file = "raw_data.csv"
+output_file = "formatted_data.csv"
+
+# Seed for trip ID generation; set to an integer for the same IDs on every run
+id_seed = None
+
+# Define the columns we want to keep
+columns_to_keep = [
+    "passenger_count",
+    "trip_distance",
+    "fare_amount",
+    "pickup_datetime",
+    "dropoff_datetime"
+]
+
+def seconds_since_midnight(times):
+    """
+    Get the time of day of each datetime as whole seconds since midnight
+    
+    Args:
+        times: pandas Series of datetime64 values
+        
+    Returns:
+        NumPy int64 array of seconds since midnight
+    """
+    # Taken straight from the underlying integer timestamps
+    return times.to_numpy().astype('datetime64[s]').astype(np.int64) % 86400
+
+def read_raw_csv(input_file):
+    """
+    Read the raw CSV into a pandas DataFrame, reading only the columns we need
+    
+    Args:
+        input_file: Path to the raw data CSV
+        
+    Returns:
+        pandas.DataFrame with the columns in columns_to_keep
+    """
+    # Use PyArrow's multithreaded CSV reader, selecting only the columns we need
+    # This reduces memory usage since we're not loading unnecessary columns
+    table = pac.read_csv(
+        input_file,
+        convert_options=pac.ConvertOptions(
+            include_columns=columns_to_keep,
+            # PyArrow infers column types from the first block of the file, so spell them
+            # out to stop e.g. an all-integer first block of fares rejecting later decimals
+            column_types={
+                col: pa.string() if DTYPES[col] == "string" else pa.from_numpy_dtype(np.dtype(pd.api.types.pandas_dtype(DTYPES[col]).type))
+                for col in columns_to_keep
+            }
+        )
+    )
+    
+    # The whole file is held in memory either way, so convert it to pandas in one go
+    return table.to_pandas()
+
+def generate_unique_ids(num_ids, id_length=6, seed=None):
+    """
+    Generate an array of unique random uppercase alphabetic IDs
+    
+    Args:
+        num_ids: Number of IDs to generate
+        id_length: Length of each ID (default 6)
+        seed: Seed for the random generator, for reproducible IDs (default None)
+        
+    Returns:
+        NumPy array of unique IDs
+    """
+    rng = np.random.default_rng(seed)
+    id_dtype = f'S{id_length}'
+    
+    # Array of unique IDs generated so far
+    all_ids = np.empty(0, dtype=id_dtype)
+    
+    # Keep generating batches until we have enough
+    while len(all_ids) < num_ids:
+        # Draw a batch of random uppercase letters ('A'-'Z'), with a little slack for duplicates
+        shortfall = num_ids - len(all_ids)
+        letters = rng.integers(65, 91, size=(int(shortfall * 1.05) + 1, id_length), dtype=np.uint8)
+        
+        # View each row of letters as one ID and drop any duplicates
+        all_ids = np.unique(np.concatenate([all_ids, letters.view(id_dtype).ravel()]))
+    
+    # np.unique returns the IDs sorted, so shuffle them before taking what we need
+    all_ids = rng.permutation(all_ids)[:num_ids]
+    
+    return all_ids.astype(f'U{id_length}')
+
+def calculate_elapsed_times(pickup_seconds, dropoff_seconds):
+    """
+    Calculate elapsed times between pickup and dropoff times of day
+    
+    Args:
+        pickup_seconds: NumPy array of pickup times in seconds since midnight
+        dropoff_seconds: NumPy array of dropoff times in seconds since midnight
+        
+    Returns:
+        NumPy float array of elapsed times in seconds
+    """
+    elapsed = (dropoff_seconds - pickup_seconds).astype(np.float64)
+    
+    # If dropoff is earlier than pickup (crossing midnight), add a day
+    # This assumes no trip is longer than 24 hours
+    return np.where(elapsed < 0, elapsed + 86400, elapsed)
+
+def build_dataset(input_file, seed=None):
+    """
+    Build the formatted dataset from the raw CSV in a single pass, without
+    writing or re-reading any intermediate file
+    
+    Args:
+        input_file: Path to the raw data CSV
+        seed: Seed for trip ID generation, for reproducible IDs (default None)
+        
+    Returns:
+        pandas.DataFrame with trip_id, the numeric columns and elapsed_time
+    """
+    df = read_raw_csv(input_file)
+    print(f"Read {len(df)} rows...")
+    
+    # Convert datetime columns to pandas datetime type and keep only the time of day
+    # The format matches "08/15/2015 06:41:46 PM"
+    pickup = seconds_since_midnight(pd.to_datetime(df['pickup_datetime'], format='%m/%d/%Y %I:%M:%S %p'))
+    dropoff = seconds_since_midnight(pd.to_datetime(df['dropoff_datetime'], format='%m/%d/%Y %I:%M:%S %p'))
+    
+    # The datetime columns are only needed for the elapsed time
+    df = df.drop(columns=['pickup_datetime', 'dropoff_datetime'])
+    df['elapsed_time'] = calculate_elapsed_times(pickup, dropoff)
+    
+    # Generate unique trip IDs
+    df.insert(0, 'trip_id', generate_unique_ids(len(df), seed=seed))
+    
+    return df
+
+def main():
+    """Main function to build the formatted dataset from the raw CSV"""
+    # Print status update
+    print(f"Reading from {input_file}...")
+    
+    df = build_dataset(input_file, seed=id_seed)
+    
+    print(f"Writing to {output_file}...")
+    
+    # Write the dataframe to a new CSV file
+    df.to_csv(output_file, index=False)
+    
+    # Print completion message
+    print(f"Done! Created {output_file} with {len(df)} rows and the following columns:")
+    for col in df.columns:
+        print(f"- {col}")
+    print("\nAdded new columns:")
+    print("- trip_id (unique 6-letter ID)")
+    print("- elapsed_time (trip duration in seconds)")
+    print("\nRemoved columns:")
+    print("- pickup_datetime")
+    print("- dropoff_datetime")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+
+# Column types shared by every script that reads the taxi data, so pandas can skip
+# type inference. Passenger counts use the nullable Int64 type so missing counts
+# stay readable, and fares and distances stay float64 so no decimal value is rounded.
+# Columns that aren't present in a given file are ignored by pd.read_csv.
+DTYPES = {
+    "trip_id": "string",
+    "passenger_count": "Int64",
+    "trip_distance": "float64",
+    "fare_amount": "float64",
+    "pickup_datetime": "string",
+    "dropoff_datetime": "string",
+    "elapsed_time": "float64"
+}
@@ -2,10 +2,97 @@
 
 import pandas as pd
 import numpy as np
-from scipy import stats
 import os
+from concurrent.futures import ThreadPoolExecutor
+from data_types import DTYPES
 from datetime import datetime
 
+def calculate_shape(values, mean):
+    """
+    Calculate skewness and kurtosis from one shared set of deviations from the mean
+    
+    Args:
+        values (numpy.ndarray): Non-missing values of a column
+        mean (float): Mean of the values
+        
+    Returns:
+        tuple: (skewness, excess kurtosis), matching scipy.stats.skew/kurtosis defaults
+    """
+    # No copy when the caller already passes float64 values
+    values = np.asarray(values, dtype=np.float64)
+    deviations = values - mean
+    squared = np.multiply(deviations, deviations)
+    
+    # Second, third and fourth central moments; once m2 is known the deviations
+    # buffer is reused for the cubed and fourth-power terms instead of allocating more
+    m2 = squared.mean()
+    m3 = np.multiply(squared, deviations, out=deviations).mean()
+    m4 = np.multiply(squared, squared, out=deviations).mean()
+    
+    # A constant column has no defined shape
+    if m2 == 0:
+        return np.nan, np.nan
+    
+    return m3 / m2 ** 1.5, m4 / m2 ** 2 - 3
+
+def calculate_column_statistics(series):
+    """
+    Calculate all descriptive statistics for a single numerical column
+    
+    Args:
+        series (pandas.Series): The column to analyze
+        
+    Returns:
+        dict: Dictionary of statistics, or None if the column has no values
+    """
+    col_data = series.dropna().to_numpy()
+    
+    if len(col_data) == 0:
+        return None
+    
+    # Work in float64 so integer columns can't overflow in the sums
+    values = col_data.astype(np.float64)
+    mean = values.mean()
+    
+    # All five percentiles from one sort of the column
+    p10, q1, median, q3, p90 = np.quantile(values, [0.1, 0.25, 0.5, 0.75, 0.9])
+    
+    # Integer columns keep integer min, max and range (widened so the range can't overflow)
+    col_min = col_data.min()
+    col_max = col_data.max()
+    if np.issubdtype(col_data.dtype, np.integer):
+        col_min = np.int64(col_min)
+        col_max = np.int64(col_max)
+    
+    # Create a dictionary for the column
+    col_stats = {}
+    
+    # Central Tendency
+    col_stats['mean'] = mean
+    col_stats['median'] = median
+    mode_values = series.mode()
+    col_stats['mode'] = mode_values.iat[0] if len(mode_values) else None
+    
+    # Dispersion (Spread)
+    col_stats['range'] = col_max - col_min
+    col_stats['variance'] = values.var(ddof=1)
+    col_stats['std_dev'] = np.sqrt(col_stats['variance'])
+    col_stats['iqr'] = q3 - q1
+    
+    # Position
+    col_stats['min'] = col_min
+    col_stats['max'] = col_max
+    col_stats['q1'] = q1
+    col_stats['q2'] = median  # Same as median
+    col_stats['q3'] = q3
+    col_stats['p10'] = p10
+    col_stats['p90'] = p90
+    
+    # Shape
+    col_stats['skewness'], col_stats['kurtosis'] = calculate_shape(values, mean)
+    
+    return col_stats
+
 def calculate_statistics(data):
     """
     Calculate all descriptive statistics for each numerical column in the dataframe
@@ -19,44 +106,12 @@ def calculate_statistics(data):
     # Get numerical columns only
     numerical_cols = data.select_dtypes(include=['number']).columns.tolist()
     
-    stats_dict = {}
-    
-    for col in numerical_cols:
-        col_data = data[col].dropna()
-        
-        if len(col_data) == 0:
-            continue
-            
-        # Create a dictionary for each column
-        col_stats = {}
-        
-        # Central Tendency
-        col_stats['mean'] = col_data.mean()
-        col_stats['median'] = col_data.median()
-        col_stats['mode'] = col_data.mode().iloc[0] if not col_data.mode().empty else None
-        
-        # Dispersion (Spread)
-        col_stats['range'] = col_data.max() - col_data.min()
-        col_stats['variance'] = col_data.var()
-        col_stats['std_dev'] = col_data.std()
-        q1 = col_data.quantile(0.25)
-        q3 = col_data.quantile(0.75)
-        col_stats['iqr'] = q3 - q1
-        
-        # Position
-        col_stats['min'] = col_data.min()
-        col_stats['max'] = col_data.max()
-        col_stats['q1'] = q1
-        col_stats['q2'] = col_data.quantile(0.5)  # Same as median
-        col_stats['q3'] = q3
-        col_stats['p10'] = col_data.quantile(0.1)
-        col_stats['p90'] = col_data.quantile(0.9)
-        
-        # Shape
-        col_stats['skewness'] = stats.skew(col_data)
-        col_stats['kurtosis'] = stats.kurtosis(col_data)
-        
-        stats_dict[col] = col_stats
+    # Columns are independent and NumPy releases the GIL for the heavy work
+    # (sorting, sums), so a thread per column runs them in parallel
+    max_workers = max(1, min(len(numerical_cols), os.cpu_count() or 1))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(calculate_column_statistics, (data[col] for col in numerical_cols))
+        stats_dict = {col: col_stats for col, col_stats in zip(numerical_cols, results) if col_stats is not None}
     
     return stats_dict
 
@@ -182,9 +237,9 @@ def main():
     
     print(f"Reading data from {input_file}...")
     
-    # Read the CSV file
+    # Read the CSV file using PyArrow's multithreaded parser
     try:
-        data = pd.read_csv(input_file)
+        data = pd.read_csv(input_file, engine='pyarrow', dtype=DTYPES)
         print(f"Successfully read data with {data.shape[0]} rows and {data.shape[1]} columns")
     except Exception as e:
         print(f"Error reading CSV file: {e}")
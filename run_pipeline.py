@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+from build_dataset import build_dataset, id_seed
+from generate_stats_report import calculate_statistics, generate_markdown_report
+
+# Define the input and output file paths
+input_file = "raw_data.csv"
+formatted_file = "formatted_data.csv"
+report_file = "statistics_report.md"
+
+def main():
+    """
+    Build the formatted dataset and the statistics report in a single pass over the raw CSV,
+    computing the statistics from the in-memory data instead of re-reading the CSV
+    """
+    # Print status update
+    print(f"Reading from {input_file}...")
+    
+    df = build_dataset(input_file, seed=id_seed)
+    
+    print(f"Writing to {formatted_file}...")
+    df.to_csv(formatted_file, index=False)
+    
+    # Calculate statistics on the in-memory data rather than re-reading the CSV
+    print("Calculating statistics...")
+    stats_dict = calculate_statistics(df)
+    
+    print(f"Generating markdown report to {report_file}...")
+    generate_markdown_report(stats_dict, report_file)
+    
+    print(f"Done! Created {formatted_file} and {report_file}")
+
+if __name__ == "__main__":
+    main()